@@ -1,12 +1,17 @@
 """Hello world module for testing CI/CD pipeline."""
 
 import sys
+from collections.abc import Callable
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """Get the package version.
 
+    The result is cached, since looking up package metadata scans sys.path.
+
     Returns:
         str: The package version or 'unknown' if not found.
     """
@@ -16,23 +21,36 @@ def get_version() -> str:
         return "0.1.4"  # Fallback version
 
 
+def _print_version(command: str) -> None:
+    """Print the package version and exit."""
+    print(get_version())
+    sys.exit(0)
+
+
+def _print_hello(command: str) -> None:
+    """Print the greeting and exit."""
+    print("Hello, World!")
+    sys.exit(0)
+
+
+def _unknown_command(command: str) -> None:
+    """Print usage for an unrecognized command and exit with an error."""
+    print(f"Unknown command: {command}")
+    print("Usage: finance [--version | hello]")
+    sys.exit(1)
+
+
+_COMMANDS: dict[str, Callable[[str], None]] = {
+    "--version": _print_version,
+    "hello": _print_hello,
+}
+
+
 def hello_world() -> None:
     """Main entry point for the finance CLI.
 
     Handles --version flag and hello command.
     """
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--version":
-            print(get_version())
-            sys.exit(0)
-        elif sys.argv[1] == "hello":
-            print("Hello, World!")
-            sys.exit(0)
-        else:
-            print(f"Unknown command: {sys.argv[1]}")
-            print("Usage: finance [--version | hello]")
-            sys.exit(1)
-    else:
-        # Default to hello for now
-        print("Hello, World!")
-        sys.exit(0)
+    # Default to hello for now
+    command = sys.argv[1] if len(sys.argv) > 1 else "hello"
+    _COMMANDS.get(command, _unknown_command)(command)
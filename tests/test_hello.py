@@ -61,9 +61,24 @@ class TestHelloWorld:
 
     def test_get_version_fallback(self) -> None:
         """Test that get_version returns fallback when package not found."""
-        with patch("finance.hello.version", side_effect=PackageNotFoundError):
-            version = get_version()
-            assert version == "0.1.4"  # Fallback version
+        get_version.cache_clear()
+        try:
+            with patch("finance.hello.version", side_effect=PackageNotFoundError):
+                version = get_version()
+                assert version == "0.1.4"  # Fallback version
+        finally:
+            get_version.cache_clear()
+
+    def test_get_version_cached(self) -> None:
+        """Test that get_version only looks up package metadata once."""
+        get_version.cache_clear()
+        try:
+            with patch("finance.hello.version", return_value="1.2.3") as mock_version:
+                assert get_version() == "1.2.3"
+                assert get_version() == "1.2.3"
+                mock_version.assert_called_once_with("finance")
+        finally:
+            get_version.cache_clear()
 
 
 class TestModule: